@@ -868,10 +868,8 @@ impl Headers {
             if line.is_empty() {
                 continue;
             }
-            let parts: Vec<_> = line.splitn_str(2, b":").map(BStr::new).collect();
-            if parts.len() == 2 {
-                let header = parts[0];
-                let value = parts[1].trim_start_with(|c| c.is_ascii_whitespace());
+            if let Some((header, value)) = line.split_once_str(b":") {
+                let value = value.trim_start_with(|c| c.is_ascii_whitespace());
                 if header.eq_ignore_ascii_case(b"patch") && !value.is_empty() {
                     headers.patchname = Some(
                         value
@@ -9,7 +9,7 @@ use clap::{Arg, ArgMatches};
 
 use crate::{
     argset,
-    color::get_color_stdout,
+    color::{buffer_stdout, get_color_stdout},
     ext::RepositoryExtended,
     patch::{patchrange, PatchName, PatchRange, RangeConstraint},
     stack::{InitializationPolicy, Stack, StackStateAccess},
@@ -191,6 +191,7 @@ fn run(matches: &ArgMatches) -> Result<()> {
         .setup_transaction()
         .use_index_and_worktree(!spill_flag)
         .with_output_stream(get_color_stdout(matches))
+        .buffer_output(buffer_stdout())
         .transact(|trans| {
             trans.reorder_patches(Some(&new_applied), Some(&new_unapplied), None)?;
             Ok(())
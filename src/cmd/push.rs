@@ -7,7 +7,7 @@ use clap::{Arg, ArgMatches};
 
 use crate::{
     argset,
-    color::get_color_stdout,
+    color::{buffer_stdout, get_color_stdout},
     ext::RepositoryExtended,
     patch::{patchrange, PatchName, PatchRange, RangeConstraint},
     stack::{InitializationPolicy, Stack, StackStateAccess},
@@ -193,13 +193,10 @@ fn run(matches: &ArgMatches) -> Result<()> {
         .allow_push_conflicts(allow_push_conflicts)
         .committer_date_is_author_date(matches.get_flag("committer-date-is-author-date"))
         .with_output_stream(get_color_stdout(matches))
+        .buffer_output(buffer_stdout())
         .transact(|trans| {
             if settree_flag {
-                for (i, patchname) in patches.iter().enumerate() {
-                    let is_last = i + 1 == patches.len();
-                    trans.push_tree(patchname, is_last)?;
-                }
-                Ok(())
+                trans.push_tree_patches(&patches)
             } else if noapply_flag {
                 let mut unapplied = patches.clone();
                 unapplied.extend(
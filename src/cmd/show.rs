@@ -140,16 +140,14 @@ fn run(matches: &ArgMatches) -> Result<()> {
         .get_many::<RangeRevisionSpec>("patchranges-all")
         .or_else(|| matches.get_many::<RangeRevisionSpec>("patchranges"))
     {
-        for spec in range_specs {
-            crate::patch::revspec::resolve(
-                &repo,
-                Some(&stack),
-                [spec],
-                RangeConstraint::AllWithAppliedBoundary,
-            )?
-            .iter()
-            .for_each(|rev| oids.push(rev.commit.id));
-        }
+        crate::patch::revspec::resolve(
+            &repo,
+            Some(&stack),
+            range_specs,
+            RangeConstraint::AllWithAppliedBoundary,
+        )?
+        .iter()
+        .for_each(|rev| oids.push(rev.commit.id));
     } else if !applied_flag && !unapplied_flag && !hidden_flag {
         oids.push(stack.get_branch_head().id);
     }
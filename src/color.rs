@@ -63,6 +63,14 @@ pub(crate) fn get_color_stdout(matches: &ArgMatches) -> StandardStream {
     StandardStream::stdout(choice)
 }
 
+/// Determine whether output to stdout should be buffered.
+///
+/// When stdout is not a terminal, output need not be seen line-by-line and may instead
+/// be written in bulk.
+pub(crate) fn buffer_stdout() -> bool {
+    !std::io::stdout().is_terminal()
+}
+
 /// Get [`termcolor::StandardStream`] for stderr based on `--color` option.
 pub(crate) fn get_color_stderr(matches: &ArgMatches) -> StandardStream {
     let mut choice = get_color_choice(Some(matches));
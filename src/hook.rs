@@ -187,8 +187,10 @@ impl<'repo> TemporaryMessage<'repo> {
 impl<'repo> Drop for TemporaryMessage<'repo> {
     fn drop(&mut self) {
         let msg_path = self.work_dir.join(&self.filename);
-        if msg_path.is_file() {
-            if let Err(e) = std::fs::remove_file(&msg_path) {
+        // Attempt removal without first checking for the file; the file's status only
+        // needs to be determined if the removal fails.
+        if let Err(e) = std::fs::remove_file(&msg_path) {
+            if e.kind() != std::io::ErrorKind::NotFound && msg_path.is_file() {
                 panic!("failed to remove temp message {msg_path:?}: {e}");
             }
         }
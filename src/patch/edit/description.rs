@@ -157,9 +157,10 @@ impl TryFrom<&[u8]> for EditedPatchDescription {
     /// returned. Blanking-out the headers and message is thus a mechanism for the user
     /// to abort the interactive edit.
     fn try_from(buf: &[u8]) -> Result<Self, Self::Error> {
-        let mut raw_patchname: Option<Option<String>> = None;
-        let mut raw_author: Option<Option<String>> = None;
-        let mut raw_authdate: Option<Option<String>> = None;
+        // Raw header values are borrowed from `buf` until they are parsed below.
+        let mut raw_patchname: Option<Option<&str>> = None;
+        let mut raw_author: Option<Option<&str>> = None;
+        let mut raw_authdate: Option<Option<&str>> = None;
         let mut consume_diff: bool = false;
         let mut consuming_message: bool = false;
         let mut consecutive_empty: usize = 0;
@@ -203,21 +204,21 @@ impl TryFrom<&[u8]> for EditedPatchDescription {
                         raw_patchname = Some(if raw_value.is_empty() {
                             None
                         } else {
-                            Some(raw_value.to_string())
+                            Some(raw_value)
                         });
                         continue;
                     } else if line_num == 1 && key == "Author" {
                         raw_author = Some(if raw_value.is_empty() {
                             None
                         } else {
-                            Some(raw_value.to_string())
+                            Some(raw_value)
                         });
                         continue;
                     } else if line_num == 2 && key == "Date" {
                         raw_authdate = Some(if raw_value.is_empty() {
                             None
                         } else {
-                            Some(raw_value.to_string())
+                            Some(raw_value)
                         });
                         continue;
                     }
@@ -254,9 +255,9 @@ impl TryFrom<&[u8]> for EditedPatchDescription {
 
         let author = if let Some(maybe_author) = raw_author {
             Some(if let Some(name_email) = maybe_author {
-                let (name, email) = super::parse::parse_name_email(&name_email)?;
+                let (name, email) = super::parse::parse_name_email(name_email)?;
                 let time = if let Some(Some(date_str)) = raw_authdate {
-                    gix::date::Time::parse_time(&date_str).context("patch description date")?
+                    gix::date::Time::parse_time(date_str).context("patch description date")?
                 } else {
                     gix::date::Time::now_local_or_utc()
                 };
@@ -2,6 +2,9 @@
 
 use anyhow::{anyhow, Result};
 
+/// Characters that delimit the email and may not otherwise appear in names or emails.
+const ANGLE_BRACKETS: [char; 2] = ['<', '>'];
+
 /// Parse name and email from string.
 ///
 /// The incoming string is expected to be of the form `name <email>`. It is an error if
@@ -27,7 +30,7 @@ pub(crate) fn parse_name_email2(name_email: &str) -> Result<(String, String)> {
 
 /// Check name string for `<` or `>` characters.
 pub(crate) fn check_name(name: &str) -> Result<()> {
-    if name.contains('<') || name.contains('>') {
+    if name.contains(ANGLE_BRACKETS) {
         Err(anyhow!("name may not contain `<` or `>`"))
     } else {
         Ok(())
@@ -41,7 +44,7 @@ pub(crate) fn parse_name(name: &str) -> Result<String> {
 
 /// Check emails string for `<` or `>` characters.
 fn check_email(email: &str) -> Result<()> {
-    if email.contains('<') || email.contains('>') {
+    if email.contains(ANGLE_BRACKETS) {
         Err(anyhow!("email may not contain `<` or `>`"))
     } else {
         Ok(())
@@ -131,7 +131,14 @@ impl PatchLocator {
     ) -> Result<PatchName, Error> {
         let DisambiguatedLocator { id, offsets } = self.disambiguate(stack);
 
-        let patches: Vec<_> = stack.all_patches().collect();
+        // Fast path for the common case of a bare name of a patch in the stack.
+        if let DisambiguatedId::Name(pn) = id {
+            if offsets.is_empty() && stack.has_patch(pn) {
+                return Ok(pn.clone());
+            }
+        }
+
+        let num_patches = stack.applied().len() + stack.unapplied().len() + stack.hidden().len();
 
         let mut index: isize = match id {
             DisambiguatedId::Name(pn) => {
@@ -149,9 +156,9 @@ impl PatchLocator {
                 }
             }
             DisambiguatedId::CommitId(oid_prefix) => {
-                let matching_names: Vec<_> = patches
-                    .iter()
-                    .filter_map(|&pn| {
+                let matching_names: Vec<_> = stack
+                    .all_patches()
+                    .filter_map(|pn| {
                         (oid_prefix.cmp_oid(&stack.get_patch_commit_id(pn)) == Ordering::Equal)
                             .then_some(pn)
                     })
@@ -174,7 +181,7 @@ impl PatchLocator {
                 }
             }
             DisambiguatedId::Index(index) => {
-                if index < patches.len() {
+                if index < num_patches {
                     Ok(index as isize)
                 } else {
                     Err(Error::InvalidPatchIndex(index))
@@ -182,7 +189,7 @@ impl PatchLocator {
             }
             DisambiguatedId::FromTop(offset) => {
                 let index = (stack.applied().len() as isize) - 1 + offset;
-                if index >= 0 && (index as usize) < patches.len() {
+                if index >= 0 && (index as usize) < num_patches {
                     Ok(index)
                 } else {
                     Err(Error::InvalidOffsetFrom(id.string_for_error()))
@@ -193,7 +200,7 @@ impl PatchLocator {
                     Err(Error::BaseNeedsPositiveOffset)
                 } else {
                     let index = -1 + offset;
-                    if (index as usize) < patches.len() {
+                    if (index as usize) < num_patches {
                         Ok(index)
                     } else {
                         Err(Error::InvalidOffsetFrom(id.string_for_error()))
@@ -201,11 +208,11 @@ impl PatchLocator {
                 }
             }
             DisambiguatedId::FromLast(offset) => {
-                if patches.is_empty() {
+                if num_patches == 0 {
                     Err(Error::NoLastPatch)
                 } else if let Some(index) = (stack.applied_and_unapplied().count() - 1)
                     .checked_add_signed(offset)
-                    .filter(|&index| index < patches.len())
+                    .filter(|&index| index < num_patches)
                 {
                     Ok(index as isize)
                 } else {
@@ -220,9 +227,7 @@ impl PatchLocator {
                 PatchOffsetAtom::Tilde(n) => index.checked_sub_unsigned(n.unwrap_or(1)),
             };
 
-            if new_index.is_none()
-                || new_index < Some(0)
-                || new_index >= Some(patches.len() as isize)
+            if new_index.is_none() || new_index < Some(0) || new_index >= Some(num_patches as isize)
             {
                 return Err(Error::InvalidPatchOffset {
                     id: id.string_for_error(),
@@ -233,7 +238,11 @@ impl PatchLocator {
             index = new_index.unwrap();
         }
 
-        Ok(patches[index as usize].clone())
+        Ok(stack
+            .all_patches()
+            .nth(index as usize)
+            .expect("index is within the stack's patches")
+            .clone())
     }
 
     /// Resolve patchname and commit object based on patch location and offsets.
@@ -246,7 +255,17 @@ impl PatchLocator {
     ) -> Result<StGitRevision<'repo>, Error> {
         let DisambiguatedLocator { id, offsets } = self.disambiguate(stack);
 
-        let patches: Vec<_> = stack.all_patches().collect();
+        // Fast path for the common case of a bare name of a patch in the stack.
+        if let DisambiguatedId::Name(pn) = id {
+            if offsets.is_empty() && stack.has_patch(pn) {
+                return Ok(StGitRevision {
+                    patchname: Some(pn.clone()),
+                    commit: stack.get_patch_commit(pn).clone(),
+                });
+            }
+        }
+
+        let num_patches = stack.applied().len() + stack.unapplied().len() + stack.hidden().len();
 
         let mut index: isize = match id {
             DisambiguatedId::Name(pn) => {
@@ -264,9 +283,9 @@ impl PatchLocator {
                 }
             }
             DisambiguatedId::CommitId(oid_prefix) => {
-                let matching_names: Vec<_> = patches
-                    .iter()
-                    .filter_map(|&pn| {
+                let matching_names: Vec<_> = stack
+                    .all_patches()
+                    .filter_map(|pn| {
                         (oid_prefix.cmp_oid(&stack.get_patch_commit_id(pn)) == Ordering::Equal)
                             .then_some(pn)
                     })
@@ -283,7 +302,7 @@ impl PatchLocator {
             DisambiguatedId::Top => Ok((stack.applied().len() as isize) - 1),
             DisambiguatedId::Base => Ok(-1),
             DisambiguatedId::Index(index) => {
-                if index < patches.len() {
+                if index < num_patches {
                     Ok(index as isize)
                 } else {
                     Err(Error::InvalidPatchIndex(index))
@@ -291,7 +310,7 @@ impl PatchLocator {
             }
             DisambiguatedId::FromTop(offset) => {
                 let index = (stack.applied().len() as isize) - 1 + offset;
-                if index >= 0 && (index as usize) < patches.len() {
+                if index >= 0 && (index as usize) < num_patches {
                     Ok(index)
                 } else {
                     Err(Error::InvalidOffsetFrom(id.string_for_error()))
@@ -299,18 +318,18 @@ impl PatchLocator {
             }
             DisambiguatedId::FromBase(offset) => {
                 let index = -1 + offset;
-                if index < 0 || (index as usize) < patches.len() {
+                if index < 0 || (index as usize) < num_patches {
                     Ok(index)
                 } else {
                     Err(Error::InvalidOffsetFrom(id.string_for_error()))
                 }
             }
             DisambiguatedId::FromLast(offset) => {
-                if patches.is_empty() {
+                if num_patches == 0 {
                     Err(Error::NoLastPatch)
                 } else if let Some(index) = (stack.applied_and_unapplied().count() - 1)
                     .checked_add_signed(offset)
-                    .filter(|&index| index < patches.len())
+                    .filter(|&index| index < num_patches)
                 {
                     Ok(index as isize)
                 } else {
@@ -325,7 +344,7 @@ impl PatchLocator {
                 PatchOffsetAtom::Tilde(n) => index.checked_sub_unsigned(n.unwrap_or(1)),
             };
 
-            if new_index.is_none() || new_index >= Some(patches.len() as isize) {
+            if new_index.is_none() || new_index >= Some(num_patches as isize) {
                 return Err(Error::InvalidPatchOffset {
                     id: id.string_for_error(),
                     offsets,
@@ -336,7 +355,11 @@ impl PatchLocator {
         }
 
         if index >= 0 {
-            let patchname = patches[index as usize].clone();
+            let patchname = stack
+                .all_patches()
+                .nth(index as usize)
+                .expect("index is within the stack's patches")
+                .clone();
             let commit = stack.get_patch_commit(&patchname).clone();
             Ok(StGitRevision {
                 patchname: Some(patchname),
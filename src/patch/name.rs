@@ -101,7 +101,11 @@ impl PatchName {
         }
 
         if lower {
-            name = name.to_lowercase();
+            if name.is_ascii() {
+                name.make_ascii_lowercase();
+            } else {
+                name = name.to_lowercase();
+            }
         }
 
         let mut candidate = name.as_str();
@@ -398,6 +402,8 @@ mod tests {
             ),
             ("__-__", "__-__", Some(10)),
             ("the name", "the-name", None),
+            ("The NAME", "the-name", None),
+            ("Ünïcode NAME", "ünïcode-name", None),
             // Long names are only shortened at '-' word boundaries.
             ("superlongname", "superlongname", Some(6)),
             ("super-longname", "super", Some(6)),
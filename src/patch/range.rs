@@ -4,6 +4,8 @@
 
 use std::str::FromStr;
 
+use indexmap::IndexSet;
+
 use super::{
     PatchName, PatchRange, PatchRangeBounds, RangeConstraint, StGitBoundaryRevisions, StGitRevision,
 };
@@ -141,11 +143,16 @@ pub(crate) fn resolve_names<'a, 'repo>(
     allow: RangeConstraint,
 ) -> Result<Vec<PatchName>, Error> {
     let allowed_patches: Vec<&PatchName> = stack.get_allowed(allow.into());
-    let mut patches: Vec<PatchName> = Vec::new();
+    // Patch names are unique, so each name's index in this set is also its position in
+    // allowed_patches. The set is only built once a position is needed.
+    let mut allowed_positions: Option<IndexSet<&PatchName>> = None;
+    let mut patches: IndexSet<PatchName> = IndexSet::new();
 
     for range in ranges {
         match range {
             PatchRange::Range(PatchRangeBounds { begin, end }) => {
+                let allowed_positions = &*allowed_positions
+                    .get_or_insert_with(|| allowed_patches.iter().copied().collect());
                 let begin = begin
                     .as_ref()
                     .map(|loc| loc.resolve_name(stack))
@@ -165,16 +172,14 @@ pub(crate) fn resolve_names<'a, 'repo>(
                     )?;
 
                 let begin_pos = begin.map_or(0, |patchname| {
-                    allowed_patches
-                        .iter()
-                        .position(|&pn| pn == &patchname)
+                    allowed_positions
+                        .get_index_of(&patchname)
                         .expect("begin patchname already constrained to the allowed patches")
                 });
 
                 let end_pos = if let Some(patchname) = end {
-                    allowed_patches
-                        .iter()
-                        .position(|&pn| pn == &patchname)
+                    allowed_positions
+                        .get_index_of(&patchname)
                         .expect("end patchname already constrained to allowed patches")
                 } else if allow.use_applied_boundary()
                     && !stack.applied().is_empty()
@@ -198,11 +203,11 @@ pub(crate) fn resolve_names<'a, 'repo>(
                 };
 
                 for pn in selected_patches {
-                    let patchname = pn.clone();
-                    if patches.contains(pn) {
-                        return Err(Error::Duplicate { patchname });
+                    if !patches.insert(pn.clone()) {
+                        return Err(Error::Duplicate {
+                            patchname: pn.clone(),
+                        });
                     }
-                    patches.push(patchname);
                 }
             }
 
@@ -210,15 +215,14 @@ pub(crate) fn resolve_names<'a, 'repo>(
                 let patchname = patch_loc
                     .resolve_name(stack)?
                     .constrain(stack, allow.into())?;
-                if patches.contains(&patchname) {
+                if !patches.insert(patchname.clone()) {
                     return Err(Error::Duplicate { patchname });
                 }
-                patches.push(patchname);
             }
         }
     }
 
-    Ok(patches)
+    Ok(patches.into_iter().collect())
 }
 
 /// Resolve user-provided patch ranges into contiguous patch names.
@@ -230,13 +234,18 @@ pub(crate) fn resolve_names_contiguous<'a>(
     allow: RangeConstraint,
 ) -> Result<Vec<PatchName>, Error> {
     let allowed_patches: Vec<&PatchName> = stack.get_allowed(allow.into());
-    let mut patches: Vec<PatchName> = Vec::new();
+    // Patch names are unique, so each name's index in this set is also its position in
+    // allowed_patches. The set is only built once a position is needed.
+    let mut allowed_positions: Option<IndexSet<&PatchName>> = None;
+    let mut patches: IndexSet<PatchName> = IndexSet::new();
     let mut next_pos: Option<usize> = None;
     let mut prev_range: Option<&PatchRange> = None;
 
     for range in ranges {
         match range {
             PatchRange::Range(PatchRangeBounds { begin, end }) => {
+                let allowed_positions = &*allowed_positions
+                    .get_or_insert_with(|| allowed_patches.iter().copied().collect());
                 let begin = begin
                     .as_ref()
                     .map(|loc| loc.resolve_name(stack))
@@ -256,9 +265,8 @@ pub(crate) fn resolve_names_contiguous<'a>(
                     )?;
 
                 let begin_pos = begin.map_or(0, |patchname| {
-                    allowed_patches
-                        .iter()
-                        .position(|&pn| pn == &patchname)
+                    allowed_positions
+                        .get_index_of(&patchname)
                         .expect("begin patchname already constrained to the allowed patches")
                 });
                 if next_pos.is_some() && Some(begin_pos) != next_pos {
@@ -269,9 +277,8 @@ pub(crate) fn resolve_names_contiguous<'a>(
                 }
 
                 let end_pos = if let Some(patchname) = end {
-                    let end_pos = allowed_patches
-                        .iter()
-                        .position(|&pn| pn == &patchname)
+                    let end_pos = allowed_positions
+                        .get_index_of(&patchname)
                         .expect("end patchname already constrained to allowed patches");
                     if end_pos < begin_pos {
                         return Err(Error::BoundaryOrder {
@@ -294,11 +301,11 @@ pub(crate) fn resolve_names_contiguous<'a>(
                 let selected_patches = allowed_patches[begin_pos..=end_pos].to_vec();
 
                 for pn in selected_patches {
-                    let patchname = pn.clone();
-                    if patches.contains(pn) {
-                        return Err(Error::Duplicate { patchname });
+                    if !patches.insert(pn.clone()) {
+                        return Err(Error::Duplicate {
+                            patchname: pn.clone(),
+                        });
                     }
-                    patches.push(patchname.clone());
                 }
 
                 next_pos = Some(end_pos + 1);
@@ -307,27 +314,25 @@ pub(crate) fn resolve_names_contiguous<'a>(
                 let patchname = patch_loc
                     .resolve_name(stack)?
                     .constrain(stack, allow.into())?;
-                if patches.contains(&patchname) {
+                let pos = allowed_positions
+                    .get_or_insert_with(|| allowed_patches.iter().copied().collect())
+                    .get_index_of(&patchname)
+                    .expect("patchname already constrained to allowed patches");
+                if !patches.insert(patchname.clone()) {
                     return Err(Error::Duplicate { patchname });
-                } else {
-                    let pos = allowed_patches
-                        .iter()
-                        .position(|&pn| pn == &patchname)
-                        .expect("patchname already constrained to allowed patches");
-                    if next_pos.is_some() && Some(pos) != next_pos {
-                        return Err(Error::NotContiguous {
-                            range: range.to_string(),
-                            prev_range: prev_range.unwrap().to_string(),
-                        });
-                    }
-                    patches.push(patchname);
-                    next_pos = Some(pos + 1);
                 }
+                if next_pos.is_some() && Some(pos) != next_pos {
+                    return Err(Error::NotContiguous {
+                        range: range.to_string(),
+                        prev_range: prev_range.unwrap().to_string(),
+                    });
+                }
+                next_pos = Some(pos + 1);
             }
         }
 
         prev_range = Some(range);
     }
 
-    Ok(patches)
+    Ok(patches.into_iter().collect())
 }
@@ -12,7 +12,11 @@
 //!   `patch` would refer to the patch `patch`'s commit. This is equivalent to
 //!   specifying `refs/stacks/<branch>/patch`.
 
-use std::{rc::Rc, str::FromStr};
+use std::{
+    collections::{btree_map::Entry, BTreeMap},
+    rc::Rc,
+    str::FromStr,
+};
 
 use anyhow::{Context, Result};
 
@@ -21,6 +25,7 @@ use super::{
     SingleRevisionSpec, StGitBoundaryRevisions, StGitRevision,
 };
 use crate::{
+    branchloc::BranchLocator,
     ext::RepositoryExtended,
     stack::{InitializationPolicy, Stack, StackAccess, StackStateAccess},
 };
@@ -169,16 +174,14 @@ pub(crate) fn resolve<'a, 'repo>(
     allow: RangeConstraint,
 ) -> Result<Vec<StGitRevision<'repo>>> {
     let mut revs = Vec::new();
+    // Stacks for explicitly specified branches are initialized once per branch locator.
+    let mut branch_stacks: BTreeMap<String, Stack<'repo>> = BTreeMap::new();
     for spec in specs {
         match spec {
             RangeRevisionSpec::BranchRange { branch_loc, bounds } => {
-                let stack = Stack::from_branch_locator(
-                    repo,
-                    Some(branch_loc),
-                    InitializationPolicy::AllowUninitialized,
-                )?;
+                let stack = branch_stack(&mut branch_stacks, repo, branch_loc)?;
                 let range = PatchRange::from(bounds);
-                for patchname in patchrange::resolve_names(&stack, [&range], allow)? {
+                for patchname in patchrange::resolve_names(stack, [&range], allow)? {
                     let commit = stack.get_patch_commit(&patchname).clone();
                     let patchname = Some(patchname);
                     revs.push(StGitRevision { patchname, commit });
@@ -201,6 +204,14 @@ pub(crate) fn resolve<'a, 'repo>(
                     }
                 }
             }
+            RangeRevisionSpec::Single(SingleRevisionSpec::Branch {
+                branch_loc,
+                patch_like,
+            }) => {
+                // Keep in sync with the `Branch` arm of `SingleRevisionSpec::resolve()`.
+                let stack = branch_stack(&mut branch_stacks, repo, branch_loc)?;
+                revs.push(patch_like.resolve(repo, stack)?);
+            }
             RangeRevisionSpec::Single(single_spec) => {
                 let rev = single_spec.resolve(repo, stack)?;
                 revs.push(rev);
@@ -210,6 +221,22 @@ pub(crate) fn resolve<'a, 'repo>(
     Ok(revs)
 }
 
+/// Get the stack for a branch locator, initializing it only if not already cached.
+fn branch_stack<'s, 'repo>(
+    branch_stacks: &'s mut BTreeMap<String, Stack<'repo>>,
+    repo: &'repo gix::Repository,
+    branch_loc: &BranchLocator,
+) -> Result<&'s Stack<'repo>> {
+    Ok(match branch_stacks.entry(branch_loc.to_string()) {
+        Entry::Occupied(entry) => &*entry.into_mut(),
+        Entry::Vacant(entry) => &*entry.insert(Stack::from_branch_locator(
+            repo,
+            Some(branch_loc),
+            InitializationPolicy::AllowUninitialized,
+        )?),
+    })
+}
+
 impl PatchLikeSpec {
     /// Resolve a patch-like revision specification.
     pub(crate) fn resolve<'a, 'repo>(
@@ -273,6 +300,7 @@ impl SingleRevisionSpec {
                 branch_loc,
                 patch_like,
             } => {
+                // Keep in sync with the cached branch stack arm of `resolve()`.
                 let stack = Stack::from_branch_locator(
                     repo,
                     Some(branch_loc),
@@ -73,16 +73,16 @@ impl<'repo> Stack<'repo> {
         } = self;
         let state_ref = repo.find_reference(&stack_refname)?;
         let patch_ref_prefix = get_patch_refname(&branch_name, "");
-        for patch_reference in
-            repo.references()?
-                .all()?
-                .filter_map(Result::ok)
-                .filter(|reference| {
-                    reference
-                        .name()
-                        .as_bstr()
-                        .starts_with(patch_ref_prefix.as_bytes())
-                })
+        for patch_reference in repo
+            .references()?
+            .prefixed(&patch_ref_prefix)?
+            .filter_map(Result::ok)
+            .filter(|reference| {
+                reference
+                    .name()
+                    .as_bstr()
+                    .starts_with(patch_ref_prefix.as_bytes())
+            })
         {
             patch_reference.delete()?;
         }
@@ -147,9 +147,14 @@ impl<'repo> Stack<'repo> {
         let stack_refname = state_refname_from_branch_name(&branch_name);
         let is_initialized;
 
-        stack_upgrade(repo, &branch_name)?;
-
-        let maybe_state_ref = repo.find_reference(&stack_refname).ok();
+        // The state reference only exists for stacks already in the current format, so
+        // the upgrade check is only needed when it is not found.
+        let maybe_state_ref = if let Ok(state_ref) = repo.find_reference(&stack_refname) {
+            Some(state_ref)
+        } else {
+            stack_upgrade(repo, &branch_name)?;
+            repo.find_reference(&stack_refname).ok()
+        };
 
         let state_and_base_from_ref =
             |state_ref: gix::Reference<'repo>| -> Result<(StackState<'repo>, Rc<gix::Commit<'repo>>)> {
@@ -455,9 +460,10 @@ fn ensure_patch_refs(repo: &gix::Repository, branch_name: &str, state: &StackSta
     let patch_ref_prefix = get_patch_refname(branch_name, "");
     let mut state_patches: BTreeMap<&PatchName, &PatchState> = state.patches.iter().collect();
 
+    // Prefixed iteration may yield references outside the prefix, so check it again.
     for mut existing_ref in repo
         .references()?
-        .all()?
+        .prefixed(&patch_ref_prefix)?
         .filter_map(Result::ok)
         .filter(|reference| {
             reference
@@ -15,6 +15,7 @@ use crate::stack::{Stack, StackAccess, StackStateAccess};
 pub(crate) struct TransactionBuilder<'repo> {
     stack: Stack<'repo>,
     output: Option<termcolor::StandardStream>,
+    buffer_output: bool,
     options: TransactionOptions,
 }
 
@@ -26,6 +27,7 @@ impl<'repo> TransactionBuilder<'repo> {
         Self {
             stack,
             output: None,
+            buffer_output: false,
             options: TransactionOptions::default(),
         }
     }
@@ -100,6 +102,15 @@ impl<'repo> TransactionBuilder<'repo> {
         self
     }
 
+    /// Buffer the transaction's output and write it to the output stream in bulk when
+    /// the transaction completes, instead of line-by-line. Output to a stream that uses
+    /// color is never buffered. By default, output is not buffered.
+    #[must_use]
+    pub(crate) fn buffer_output(mut self, buffer: bool) -> Self {
+        self.buffer_output = buffer;
+        self
+    }
+
     /// Determines whether the branch and stack metadata refs should be updated when the
     /// transaction executes successfully. This is the default. Disabling this is only
     /// useful in very special circumstances (e.g. for `stg uncommit`).
@@ -136,11 +147,14 @@ impl<'repo> TransactionBuilder<'repo> {
         let Self {
             stack,
             output,
+            buffer_output,
             options,
         } = self;
 
-        let ui =
-            TransactionUserInterface::new(output.expect("with_output_stream() must be called"));
+        let ui = TransactionUserInterface::new(
+            output.expect("with_output_stream() must be called"),
+            buffer_output,
+        );
 
         let current_tree_id = stack
             .get_branch_head()
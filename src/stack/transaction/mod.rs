@@ -535,10 +535,18 @@ impl<'repo> StackTransaction<'repo> {
     where
         P: AsRef<PatchName>,
     {
+        let mut notes_to_copy = Vec::with_capacity(patchnames.len());
         for (i, patchname) in patchnames.iter().enumerate() {
             let is_last = i + 1 == patchnames.len();
-            self.push_tree(patchname.as_ref(), is_last)?;
+            self.push_tree(patchname.as_ref(), is_last, &mut notes_to_copy)?;
         }
+        // Notes for all of the pushed patches are copied with one git invocation.
+        // Failure to copy is okay because the old commits may not have notes to copy.
+        self.stack
+            .repo
+            .stupid()
+            .notes_copy_many(&notes_to_copy)
+            .ok();
         Ok(())
     }
 
@@ -548,7 +556,16 @@ impl<'repo> StackTransaction<'repo> {
     /// which typically results in a new tree being associated with the pushed patch's
     /// commit. For this operation, instead of applying the pushed patch's diff to the
     /// topmost patch's tree, the pushed patch's tree is preserved as-is.
-    pub(crate) fn push_tree(&mut self, patchname: &PatchName, is_last: bool) -> Result<()> {
+    ///
+    /// The `(old, new)` commit id pair for a rewritten patch commit is added to
+    /// `notes_to_copy` so that the caller may copy the notes of all pushed patches at
+    /// once.
+    fn push_tree(
+        &mut self,
+        patchname: &PatchName,
+        is_last: bool,
+        notes_to_copy: &mut Vec<(gix::ObjectId, gix::ObjectId)>,
+    ) -> Result<()> {
         let patch_commit = self.get_patch_commit(patchname);
         let repo = self.stack.repo;
         let parent = patch_commit.get_parent_commit()?;
@@ -577,9 +594,7 @@ impl<'repo> StackTransaction<'repo> {
             )?;
 
             let commit = repo.find_commit(new_commit_id)?;
-            repo.stupid()
-                .notes_copy(patch_commit.id, new_commit_id)
-                .ok();
+            notes_to_copy.push((patch_commit.id, new_commit_id));
             self.updated_patches.insert(
                 patchname.clone(),
                 Some(PatchState {
@@ -701,13 +716,15 @@ impl<'repo> StackTransaction<'repo> {
             .count();
 
         let to_push: Vec<PatchName> = if num_common < to_commit.len() {
+            let to_commit_set: IndexSet<&PatchName> = to_commit.iter().collect();
             let to_push: Vec<PatchName> = self.applied()[num_common..]
                 .iter()
-                .filter(|pn| !to_commit.contains(*pn))
+                .filter(|pn| !to_commit_set.contains(*pn))
                 .cloned()
                 .collect();
 
-            self.pop_patches(|pn| to_push.contains(pn))?;
+            let to_pop: IndexSet<&PatchName> = to_push.iter().collect();
+            self.pop_patches(|pn| to_pop.contains(pn))?;
             self.push_patches(&to_commit[num_common..], false)?;
             to_push
         } else {
@@ -754,17 +771,19 @@ impl<'repo> StackTransaction<'repo> {
     /// Hidden patches are not shown by default by `stg series` and are excluded from
     /// several other operations.
     pub(crate) fn hide_patches(&mut self, to_hide: &[PatchName]) -> Result<()> {
+        let to_hide_set: IndexSet<&PatchName> = to_hide.iter().collect();
+
         let applied: Vec<PatchName> = self
             .applied
             .iter()
-            .filter(|pn| !to_hide.contains(pn))
+            .filter(|pn| !to_hide_set.contains(*pn))
             .cloned()
             .collect();
 
         let unapplied: Vec<PatchName> = self
             .unapplied
             .iter()
-            .filter(|pn| !to_hide.contains(pn))
+            .filter(|pn| !to_hide_set.contains(*pn))
             .cloned()
             .collect();
 
@@ -784,10 +803,11 @@ impl<'repo> StackTransaction<'repo> {
             .cloned()
             .collect();
 
+        let to_unhide_set: IndexSet<&PatchName> = to_unhide.iter().collect();
         let hidden: Vec<PatchName> = self
             .hidden
             .iter()
-            .filter(|pn| !to_unhide.contains(pn))
+            .filter(|pn| !to_unhide_set.contains(*pn))
             .cloned()
             .collect();
 
@@ -964,11 +984,16 @@ impl<'repo> StackTransaction<'repo> {
         P: AsRef<PatchName>,
     {
         let stupid = self.stack.repo.stupid();
-        stupid.with_temp_index(|stupid_temp| {
+        let mut notes_to_copy = Vec::with_capacity(patchnames.len());
+        let push_result = stupid.with_temp_index(|stupid_temp| {
             let mut temp_index_tree_id: Option<gix::ObjectId> = None;
 
-            let merged = if check_merged {
-                Some(self.check_merged(patchnames, stupid_temp, &mut temp_index_tree_id)?)
+            let merged: Option<IndexSet<&PatchName>> = if check_merged {
+                Some(
+                    self.check_merged(patchnames, stupid_temp, &mut temp_index_tree_id)?
+                        .into_iter()
+                        .collect(),
+                )
             } else {
                 None
             };
@@ -978,18 +1003,27 @@ impl<'repo> StackTransaction<'repo> {
                 let is_last = i + 1 == patchnames.len();
                 let already_merged = merged
                     .as_ref()
-                    .map_or(false, |merged| merged.contains(&patchname));
+                    .map_or(false, |merged| merged.contains(patchname));
                 self.push_patch(
                     patchname,
                     already_merged,
                     is_last,
                     stupid_temp,
                     &mut temp_index_tree_id,
+                    &mut notes_to_copy,
                 )?;
             }
 
             Ok(())
-        })
+        });
+
+        // Notes are copied with one git invocation for all of the pushed patches,
+        // including those pushed before a halt. As with copying the notes of
+        // individual patches, failure to copy is okay because the old commits may
+        // not have notes to copy.
+        stupid.notes_copy_many(&notes_to_copy).ok();
+
+        push_result
     }
 
     fn push_patch(
@@ -999,6 +1033,7 @@ impl<'repo> StackTransaction<'repo> {
         is_last: bool,
         stupid_temp: &StupidContext,
         temp_index_tree_id: &mut Option<gix::ObjectId>,
+        notes_to_copy: &mut Vec<(gix::ObjectId, gix::ObjectId)>,
     ) -> Result<()> {
         let repo = self.stack.repo;
         let config = repo.config_snapshot();
@@ -1119,7 +1154,7 @@ impl<'repo> StackTransaction<'repo> {
                 [new_parent.id],
             )?;
             let commit = Rc::new(repo.find_commit(commit_id)?);
-            stupid.notes_copy(patch_commit.id, commit_id).ok();
+            notes_to_copy.push((patch_commit.id, commit_id));
             if push_status == PushStatus::Conflict {
                 // In the case of a conflict, update() will be called after the
                 // execute() performs the checkout. Setting the transaction head
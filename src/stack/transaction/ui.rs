@@ -1,6 +1,9 @@
 // SPDX-License-Identifier: GPL-2.0-only
 
-use std::{cell::RefCell, io::Write};
+use std::{
+    cell::{RefCell, RefMut},
+    io::Write,
+};
 
 use anyhow::Result;
 use termcolor::WriteColor;
@@ -9,25 +12,49 @@ use super::PushStatus;
 use crate::patch::PatchName;
 
 /// User output for stack transactions.
+///
+/// When buffered, output is collected in memory and written to the output stream in
+/// bulk, instead of line-by-line, when the user interface is dropped.
 pub(super) struct TransactionUserInterface {
     output: RefCell<termcolor::StandardStream>,
+    buffer: Option<RefCell<termcolor::NoColor<Vec<u8>>>>,
     printed_top: bool,
 }
 
 impl TransactionUserInterface {
-    pub(super) fn new(output: termcolor::StandardStream) -> TransactionUserInterface {
+    /// Create user interface writing to `output`.
+    ///
+    /// Buffering is only done when `buffered` is true and `output` does not use color.
+    pub(super) fn new(
+        output: termcolor::StandardStream,
+        buffered: bool,
+    ) -> TransactionUserInterface {
+        let buffer = (buffered && !output.supports_color())
+            .then(|| RefCell::new(termcolor::NoColor::new(Vec::new())));
         TransactionUserInterface {
             output: RefCell::new(output),
+            buffer,
             printed_top: false,
         }
     }
 
+    /// Get the writer for user output; either the buffer or the output stream.
+    fn output(&self) -> RefMut<'_, dyn WriteColor> {
+        if let Some(buffer) = self.buffer.as_ref() {
+            RefMut::map(buffer.borrow_mut(), |buffer| buffer as &mut dyn WriteColor)
+        } else {
+            RefMut::map(self.output.borrow_mut(), |output| {
+                output as &mut dyn WriteColor
+            })
+        }
+    }
+
     pub(super) fn printed_top(&self) -> bool {
         self.printed_top
     }
 
     pub(super) fn print_merged(&self, merged_patches: &[&PatchName]) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         write!(output, "Found ")?;
         let mut color_spec = termcolor::ColorSpec::new();
         output.set_color(color_spec.set_fg(Some(termcolor::Color::Blue)))?;
@@ -43,7 +70,7 @@ impl TransactionUserInterface {
         old_patchname: &PatchName,
         new_patchname: &PatchName,
     ) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         let mut color_spec = termcolor::ColorSpec::new();
         output.set_color(color_spec.set_dimmed(true))?;
         write!(output, "{old_patchname}")?;
@@ -56,7 +83,7 @@ impl TransactionUserInterface {
     }
 
     pub(super) fn print_committed(&self, committed: &[PatchName]) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         let mut color_spec = termcolor::ColorSpec::new();
         output.set_color(color_spec.set_fg(Some(termcolor::Color::Yellow)))?;
         write!(output, "$ ")?;
@@ -77,7 +104,7 @@ impl TransactionUserInterface {
 
     pub(super) fn print_uncommitted(&mut self, uncommitted: &[PatchName]) -> Result<()> {
         if !uncommitted.is_empty() {
-            let mut output = self.output.borrow_mut();
+            let mut output = self.output();
             let mut color_spec = termcolor::ColorSpec::new();
             output.set_color(color_spec.set_fg(Some(termcolor::Color::Green)))?;
             write!(output, "+ ")?;
@@ -95,7 +122,7 @@ impl TransactionUserInterface {
 
     pub(super) fn print_deleted(&self, deleted: &[PatchName]) -> Result<()> {
         if !deleted.is_empty() {
-            let mut output = self.output.borrow_mut();
+            let mut output = self.output();
             let mut color_spec = termcolor::ColorSpec::new();
             output.set_color(color_spec.set_fg(Some(termcolor::Color::Yellow)))?;
             write!(output, "# ")?;
@@ -116,7 +143,7 @@ impl TransactionUserInterface {
     }
 
     pub(super) fn print_hidden(&self, hidden: &[PatchName]) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         let mut color_spec = termcolor::ColorSpec::new();
         for patchname in hidden {
             output.set_color(color_spec.set_fg(Some(termcolor::Color::Red)))?;
@@ -131,7 +158,7 @@ impl TransactionUserInterface {
     }
 
     pub(super) fn print_unhidden(&self, unhidden: &[PatchName]) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         let mut color_spec = termcolor::ColorSpec::new();
         for patchname in unhidden {
             output.set_color(color_spec.set_fg(Some(termcolor::Color::Magenta)))?;
@@ -147,7 +174,7 @@ impl TransactionUserInterface {
 
     pub(super) fn print_popped(&self, popped: &[PatchName]) -> Result<()> {
         if !popped.is_empty() {
-            let mut output = self.output.borrow_mut();
+            let mut output = self.output();
             let mut color_spec = termcolor::ColorSpec::new();
             output.set_color(color_spec.set_fg(Some(termcolor::Color::Magenta)))?;
             write!(output, "- ")?;
@@ -173,7 +200,7 @@ impl TransactionUserInterface {
         status: PushStatus,
         is_last: bool,
     ) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         let sigil = if is_last { '>' } else { '+' };
         let mut color_spec = termcolor::ColorSpec::new();
         output.set_color(
@@ -208,7 +235,7 @@ impl TransactionUserInterface {
     }
 
     pub(super) fn print_top(&self, patchname: &PatchName) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         let mut color_spec = termcolor::ColorSpec::new();
         output.set_color(color_spec.set_fg(Some(termcolor::Color::Blue)))?;
         write!(output, "> ")?;
@@ -220,7 +247,7 @@ impl TransactionUserInterface {
     }
 
     pub(super) fn print_rolled_back(&self, patchname: Option<&PatchName>) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         let mut color_spec = termcolor::ColorSpec::new();
         output.set_color(color_spec.set_fg(Some(termcolor::Color::Blue)))?;
         write!(output, "@ ")?;
@@ -237,7 +264,7 @@ impl TransactionUserInterface {
     }
 
     pub(super) fn print_updated(&self, patchname: &PatchName, applied: &[PatchName]) -> Result<()> {
-        let mut output = self.output.borrow_mut();
+        let mut output = self.output();
         let (is_applied, is_top) = if let Some(pos) = applied.iter().position(|pn| pn == patchname)
         {
             (true, pos + 1 == applied.len())
@@ -259,3 +286,14 @@ impl TransactionUserInterface {
         Ok(())
     }
 }
+
+impl Drop for TransactionUserInterface {
+    fn drop(&mut self) {
+        if let Some(buffer) = self.buffer.take() {
+            let buffer = buffer.into_inner().into_inner();
+            let output = self.output.get_mut();
+            // Errors writing the buffered output cannot be reported from drop.
+            output.write_all(&buffer).and_then(|_| output.flush()).ok();
+        }
+    }
+}
@@ -8,8 +8,9 @@ use std::{
     cell::RefCell,
     ffi::{OsStr, OsString},
     io::Write,
-    path::Path,
+    path::{Path, PathBuf},
     process::{Command, Stdio},
+    sync::Mutex,
 };
 
 use anyhow::{anyhow, Context, Result};
@@ -24,13 +25,19 @@ use super::{
     version::StupidVersion,
 };
 
+/// Version of the `git` executable, interrogated at most once per process.
+///
+/// The same `git` from `PATH` is run by every [`StupidContext`], so the version is
+/// shared by all contexts instead of being interrogated anew by each one.
+static GIT_VERSION: Mutex<Option<StupidVersion>> = Mutex::new(None);
+
 /// Context for running stupid commands.
 #[derive(Clone, Debug, Default)]
 pub(crate) struct StupidContext<'repo, 'index> {
     pub(super) git_dir: Option<&'repo Path>,
     pub(super) work_dir: Option<&'repo Path>,
     pub(super) index_filename: Option<&'index Path>,
-    pub(super) git_version: RefCell<Option<StupidVersion>>,
+    pub(super) git_dir_realpath: RefCell<Option<PathBuf>>,
 }
 
 impl<'repo, 'index> StupidContext<'repo, 'index> {
@@ -49,7 +56,7 @@ impl<'repo, 'index> StupidContext<'repo, 'index> {
             git_dir: self.git_dir,
             work_dir: self.work_dir,
             index_filename: Some(temp_index.filename()),
-            git_version: RefCell::new(None),
+            git_dir_realpath: self.git_dir_realpath.clone(),
         };
 
         f(&stupid_temp)
@@ -69,11 +76,7 @@ impl<'repo, 'index> StupidContext<'repo, 'index> {
             .work_dir
             .expect("work_dir is required for this command");
         command.current_dir(work_dir);
-        let cwd = std::env::current_dir()?;
-        let realpath =
-            |path| gix::path::realpath_opts(path, cwd.as_path(), gix::path::realpath::MAX_SYMLINKS);
-        if let Some(git_dir) = self.git_dir {
-            let git_dir = realpath(git_dir)?;
+        if let Some(git_dir) = self.git_dir_realpath()? {
             if let Some(index_filename) = self.index_filename {
                 command.env("GIT_INDEX_FILE", git_dir.join(index_filename));
             }
@@ -83,6 +86,27 @@ impl<'repo, 'index> StupidContext<'repo, 'index> {
         Ok(command)
     }
 
+    /// Get the real path of the git dir, resolving it at most once per context.
+    fn git_dir_realpath(&self) -> Result<Option<PathBuf>> {
+        if let Some(git_dir) = self.git_dir {
+            let mut git_dir_realpath = self.git_dir_realpath.borrow_mut();
+            if let Some(realpath) = git_dir_realpath.as_ref() {
+                Ok(Some(realpath.clone()))
+            } else {
+                let cwd = std::env::current_dir()?;
+                let realpath = gix::path::realpath_opts(
+                    git_dir,
+                    cwd.as_path(),
+                    gix::path::realpath::MAX_SYMLINKS,
+                )?;
+                git_dir_realpath.replace(realpath.clone());
+                Ok(Some(realpath))
+            }
+        } else {
+            Ok(None)
+        }
+    }
+
     fn setup_git_env(&self, command: &mut Command) {
         self.git_dir.map(|git_dir| command.env("GIT_DIR", git_dir));
         self.work_dir
@@ -98,7 +122,9 @@ impl<'repo, 'index> StupidContext<'repo, 'index> {
     }
 
     fn at_least_version(&self, version: &StupidVersion) -> Result<bool> {
-        let mut git_version = self.git_version.borrow_mut();
+        let mut git_version = GIT_VERSION
+            .lock()
+            .expect("git version lock is not poisoned");
         if let Some(git_version) = git_version.as_ref() {
             Ok(git_version >= version)
         } else {
@@ -892,6 +918,29 @@ impl<'repo, 'index> StupidContext<'repo, 'index> {
         Ok(())
     }
 
+    /// Copy notes between many pairs of objects using a single `git notes copy --stdin`.
+    ///
+    /// Each pair is `(from_oid, to_oid)`. Pairs whose source object has no notes are
+    /// skipped by git; an error is returned if any pair otherwise fails to copy.
+    pub(crate) fn notes_copy_many(
+        &self,
+        oid_pairs: &[(gix::ObjectId, gix::ObjectId)],
+    ) -> Result<()> {
+        if oid_pairs.is_empty() {
+            return Ok(());
+        }
+        let input: String = oid_pairs
+            .iter()
+            .map(|(from_oid, to_oid)| format!("{from_oid} {to_oid}\n"))
+            .collect();
+        self.git()
+            .args(["notes", "copy", "--stdin"])
+            .stdout(Stdio::null())
+            .in_and_out(input.as_bytes())?
+            .require_success("notes copy")?;
+        Ok(())
+    }
+
     /// Read content of a tree into specified index using `git read-tree`.
     pub(crate) fn read_tree(&self, tree_id: gix::ObjectId) -> Result<()> {
         self.git_in_work_root()?
@@ -32,7 +32,7 @@ impl<'repo, 'index> Stupid<'repo, 'index> for gix::Repository {
             git_dir: Some(self.git_dir()),
             work_dir: self.work_dir(),
             index_filename: None,
-            git_version: RefCell::new(None::<self::version::StupidVersion>),
+            git_dir_realpath: RefCell::new(None),
         }
     }
 }
@@ -48,7 +48,6 @@ impl<'repo> TempIndex<'repo> {
 impl<'repo> Drop for TempIndex<'repo> {
     fn drop(&mut self) {
         let index_path = self.git_dir.join(self.filename());
-        assert!(index_path.is_file());
         if let Err(e) = std::fs::remove_file(&index_path) {
             panic!("failed to remove temp index {index_path:?}: {e}");
         }